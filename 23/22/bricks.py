@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def parse(data):
+    """Bricks as an (N, 6) array of x1, y1, z1, x2, y2, z2 with x1 <= x2 etc."""
+    rows = [list(map(int, line.replace("~", ",").split(","))) for line in data if line]
+    b = np.array(rows, dtype=np.int64).reshape(-1, 6)
+    return np.concatenate([np.minimum(b[:, :3], b[:, 3:]), np.maximum(b[:, :3], b[:, 3:])], axis=1)
+
+
+class BrickStack:
+    """Settle bricks once and keep the support DAG between them.
+
+    Bricks fall in order of their lower end against a 2D height map and a map
+    of the brick currently on top of every column, so memory only depends on
+    the footprint of the stack and not on its volume.
+    """
+
+    def __init__(self, bricks):
+        self.bricks = np.array(bricks, dtype=np.int64)
+        n = len(self.bricks)
+        self.order = np.argsort(self.bricks[:, 2], kind="stable")
+        self.supported_by = [[] for _ in range(n)]
+        self.supports = [[] for _ in range(n)]
+
+        x_max, y_max = self.bricks[:, 3].max() + 1, self.bricks[:, 4].max() + 1
+        height = np.zeros((x_max, y_max), dtype=np.int64)
+        top = np.full((x_max, y_max), -1, dtype=np.int64)
+        for i in self.order:
+            x1, y1, z1, x2, y2, z2 = self.bricks[i]
+            footprint = (slice(x1, x2 + 1), slice(y1, y2 + 1))
+            h = height[footprint].max()
+            if h > 0:
+                below = np.unique(top[footprint][height[footprint] == h])
+                self.supported_by[i] = below.tolist()
+                for s in below:
+                    self.supports[s].append(int(i))
+            self.bricks[i, 2], self.bricks[i, 5] = h + 1, h + 1 + z2 - z1
+            height[footprint] = h + 1 + z2 - z1
+            top[footprint] = i
+
+    def __len__(self):
+        return len(self.bricks)
+
+    def dominators(self):
+        """Immediate dominator of every brick in the support DAG, -1 for the ground.
+
+        Settling order is a topological order, so each brick's dominator is the
+        lowest common ancestor of its supporters in the tree built so far.
+        """
+        n = len(self)
+        idom = np.full(n, -1, dtype=np.int64)
+        depth = np.zeros(n, dtype=np.int64)
+        for i in self.order:
+            below = self.supported_by[i]
+            if not below:
+                continue
+            d = below[0]
+            for s in below[1:]:
+                a, b = d, s
+                while a != b:
+                    if a == -1 or b == -1:
+                        a = b = -1
+                    elif depth[a] >= depth[b]:
+                        a = idom[a]
+                    else:
+                        b = idom[b]
+                d = a
+            idom[i] = d
+            depth[i] = 1 if d == -1 else depth[d] + 1
+        return idom
+
+    def chain_reaction(self):
+        """Number of other bricks that fall when each brick is removed."""
+        idom = self.dominators()
+        size = np.ones(len(self), dtype=np.int64)
+        for i in self.order[::-1]:
+            if idom[i] >= 0:
+                size[idom[i]] += size[i]
+        return size - 1
+
+    def disintegratable(self):
+        """Bricks that are not the only support of any other brick."""
+        sole = {below[0] for below in self.supported_by if len(below) == 1}
+        return [i for i in range(len(self)) if i not in sole]
@@ -0,0 +1,65 @@
+import numpy as np
+
+
+def label_regions(field: np.ndarray):
+    """Label connected components of equal values.
+
+    Union-find over all grid edges at once: every round hooks the larger of two
+    touching roots onto the smaller one and then compresses with pointer
+    jumping. The number of trees at least halves per round, so a million-cell
+    map needs a handful of whole-array passes.
+    Returns the label grid (0..n-1) and the number of regions.
+    """
+    field = np.asarray(field)
+    idx = np.arange(field.size).reshape(field.shape)
+    same_x = field[1:, :] == field[:-1, :]
+    same_y = field[:, 1:] == field[:, :-1]
+    u = np.concatenate([idx[1:, :][same_x], idx[:, 1:][same_y]])
+    v = np.concatenate([idx[:-1, :][same_x], idx[:, :-1][same_y]])
+
+    parent = idx.ravel().copy()
+    while True:
+        pu, pv = parent[u], parent[v]
+        open_ = pu != pv
+        if not open_.any():
+            break
+        u, v, pu, pv = u[open_], v[open_], pu[open_], pv[open_]
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+        while True:
+            jumped = parent[parent]
+            if (jumped == parent).all():
+                break
+            parent = jumped
+
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels.reshape(field.shape), len(roots)
+
+
+def region_stats(labels: np.ndarray, n: int = None):
+    """Area, perimeter and number of sides for every region of a label grid.
+
+    Perimeter counts the cell borders to a different label. Sides equal the
+    number of corners, found in the 2x2 window around every cell corner: two
+    foreign orthogonal neighbors make a convex corner, two own neighbors with a
+    foreign diagonal a concave one.
+    """
+    n = labels.max() + 1 if n is None else n
+    flat = labels.ravel()
+    padded = np.pad(labels, 1, constant_values=-1)
+    m, k = labels.shape
+
+    def shifted(dx, dy):
+        return padded[1 + dx : 1 + dx + m, 1 + dy : 1 + dy + k] == labels
+
+    own = {(dx, dy): shifted(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy}
+    borders = sum((~own[d]).astype(np.int64) for d in [(1, 0), (-1, 0), (0, 1), (0, -1)])
+    corners = np.zeros(labels.shape, dtype=np.int64)
+    for dx in (-1, 1):
+        for dy in (-1, 1):
+            a, b, diag = own[(dx, 0)], own[(0, dy)], own[(dx, dy)]
+            corners += (~a & ~b) | (a & b & ~diag)
+
+    area = np.bincount(flat, minlength=n)
+    perimeter = np.bincount(flat, weights=borders.ravel(), minlength=n).astype(np.int64)
+    sides = np.bincount(flat, weights=corners.ravel(), minlength=n).astype(np.int64)
+    return area, perimeter, sides
@@ -0,0 +1,89 @@
+import re
+from math import gcd
+
+import numpy as np
+
+_numbers = re.compile(r"\d+")
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def parse_machines(text: str) -> np.ndarray:
+    """Parse all machines into rows of (ax, ay, bx, by, gx, gy)."""
+    values = list(map(int, _numbers.findall(text)))
+    return np.array(values, dtype=np.int64).reshape(-1, 6)
+
+
+def solve_machines(machines, offset=0, cost=(3, 1), max_presses=None) -> np.ndarray:
+    """Token cost per machine, 0 for machines whose prize can't be won.
+
+    Every 2x2 system is solved at once with integer Cramer's rule, so there
+    is no float rounding even for prizes around 10^13. The int64 path is used
+    whenever the determinants can't overflow, otherwise the same arithmetic
+    runs on Python ints in an object array.
+    """
+    machines = np.asarray(machines, dtype=object).reshape(-1, 6).copy()
+    machines[:, 4:] += offset
+    ca, cb = cost
+    buttons = max((abs(int(v)) for v in machines[:, :4].flat), default=0)
+    goals = max((abs(int(v)) for v in machines[:, 4:].flat), default=0)
+    if 2 * buttons * max(buttons, goals) * max(ca + cb, 1) <= _INT64_MAX:
+        machines = machines.astype(np.int64)
+    ax, ay, bx, by, gx, gy = machines.T
+
+    det = ax * by - bx * ay
+    an = gx * by - gy * bx
+    bn = ax * gy - ay * gx
+    safe = np.where(det == 0, 1, det)
+    a, b = an // safe, bn // safe
+    ok = (det != 0) & (an % safe == 0) & (bn % safe == 0) & (a >= 0) & (b >= 0)
+    if max_presses is not None:
+        ok &= (a <= max_presses) & (b <= max_presses)
+    costs = np.where(ok, ca * a + cb * b, 0)
+
+    for i in np.flatnonzero(det == 0):
+        costs[i] = _solve_degenerate(*map(int, machines[i]), ca, cb, max_presses)
+    return costs
+
+
+def _solve_degenerate(ax, ay, bx, by, gx, gy, ca, cb, max_presses):
+    # collinear buttons: the system collapses to a single diophantine equation
+    if ax * gy != ay * gx or bx * gy != by * gx:
+        return 0
+    p, q, r = (ax, bx, gx) if (ax, bx) != (0, 0) else (ay, by, gy)
+    if (p, q) == (0, 0):
+        return 0
+    limit = max_presses if max_presses is not None else float("inf")
+    candidates = []
+    if p == 0 or q == 0:
+        step = q if p == 0 else p
+        if r % step == 0 and 0 <= r // step <= limit:
+            candidates.append((0, r // step) if p == 0 else (r // step, 0))
+    else:
+        g = gcd(p, q)
+        if r % g:
+            return 0
+        s, t = _ext_gcd(p, q)
+        a0, b0 = s * (r // g), t * (r // g)
+        da, db = q // g, p // g
+        # a = a0 + k*da >= 0 and b = b0 - k*db >= 0
+        kmin = -(a0 // da)
+        kmax = b0 // db
+        if max_presses is not None:
+            kmax = min(kmax, (max_presses - a0) // da)
+            kmin = max(kmin, -((max_presses - b0) // db))
+        for k in (kmin, kmax):
+            if kmin <= k <= kmax:
+                candidates.append((a0 + k * da, b0 - k * db))
+    valid = [
+        ca * a + cb * b
+        for a, b in candidates
+        if a * ax + b * bx == gx and a * ay + b * by == gy
+    ]
+    return min(valid, default=0)
+
+
+def _ext_gcd(a, b):
+    if b == 0:
+        return 1, 0
+    s, t = _ext_gcd(b, a % b)
+    return t, s - (a // b) * t
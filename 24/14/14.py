@@ -32,11 +32,17 @@ robots = [
     for px, py in [p.split("=")[1].split(",")]
     for vx, vy in [v.split("=")[1].split(",")]
 ]
+# Part 2
+# step through the seconds until the tree shows up, 0 or end of input stops
 shape = Vec(101, 103)
 count = 0
 i = 1
 while i != 0:
-    if x := input(f"{count}, steps: "):
+    try:
+        x = input(f"{count}, steps: ")
+    except EOFError:
+        break
+    if x:
         i = int(x)
     else: i = 1
     robots = [get_pos_after_sec(robot, i, shape) for robot in robots]
@@ -0,0 +1,167 @@
+import re
+
+import numpy as np
+
+_numbers = re.compile(r"\d+")
+
+ADV, BXL, BST, JNZ, BXC, OUT, BDV, CDV = range(8)
+
+
+def parse(text: str):
+    """Split the puzzle input into the registers (A, B, C) and the program."""
+    regs, program = text.split("\n\n")
+    return tuple(map(int, _numbers.findall(regs))), list(map(int, _numbers.findall(program)))
+
+
+def _combo(op):
+    if op == 7:
+        raise ValueError("combo operand 7 is reserved")
+    return ("0", "1", "2", "3", "a", "b", "c")[op]
+
+
+def _stmt(opcode, op):
+    if opcode == ADV:
+        return f"a >>= {_combo(op)}"
+    if opcode == BXL:
+        return f"b ^= {op}"
+    if opcode == BST:
+        return f"b = {_combo(op)} & 7"
+    if opcode == BXC:
+        return "b ^= c"
+    if opcode == OUT:
+        return f"out.append({_combo(op)} & 7)"
+    if opcode == BDV:
+        return f"b = a >> {_combo(op)}"
+    if opcode == CDV:
+        return f"c = a >> {_combo(op)}"
+    raise ValueError(f"unknown opcode {opcode}")
+
+
+def _compile(program):
+    # one straight-line block per reachable entry point, blocks only end at a jnz
+    n = len(program)
+    entries = {0}
+    for i in range(0, n - 1, 2):
+        if program[i] == JNZ:
+            entries |= {program[i + 1], i + 2}
+    lines = ["def run(a, b, c):", "    out = []", "    ip = 0", "    while True:"]
+    for k, entry in enumerate(sorted(e for e in entries if e < n - 1)):
+        lines.append(f"        {'elif' if k else 'if'} ip == {entry}:")
+        i = entry
+        while i < n - 1:
+            opcode, op = program[i], program[i + 1]
+            if opcode == JNZ:
+                lines += [
+                    "            if a:",
+                    f"                ip = {op}",
+                    "                continue",
+                    f"            ip = {i + 2}",
+                    "            continue",
+                ]
+                break
+            try:
+                lines.append(f"            {_stmt(opcode, op)}")
+            except ValueError as e:
+                lines.append(f"            raise ValueError({str(e)!r})")
+            i += 2
+        else:
+            lines.append("            return out")
+    lines.append("        return out")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["run"]
+
+
+def _shr(x, s):
+    # numpy leaves shifts by >= 64 undefined, the VM wants them to clear the register
+    s = np.asarray(s, dtype=np.uint64)
+    return np.where(s >= 64, np.uint64(0), x >> np.minimum(s, np.uint64(63)))
+
+
+class VM:
+    def __init__(self, program):
+        self.program = list(program)
+        self._run = _compile(self.program)
+
+    def __repr__(self):
+        return f"VM({','.join(map(str, self.program))})"
+
+    def run(self, a, b=0, c=0):
+        return self._run(a, b, c)
+
+    def output(self, a, b=0, c=0):
+        return ",".join(map(str, self.run(a, b, c)))
+
+    def run_batch(self, a, b=0, c=0, max_steps=100_000):
+        """Run the program for every value in `a` at once.
+
+        Returns the outputs as an (N, L) int8 array padded with -1 together
+        with the output length of every lane.
+        """
+        a = np.asarray(a, dtype=np.uint64).ravel()
+        lanes = len(a)
+        regs = np.empty((3, lanes), dtype=np.uint64)
+        regs[0], regs[1], regs[2] = a, b, c
+        ip = np.zeros(lanes, dtype=np.int64)
+        out = np.full((lanes, 8), -1, dtype=np.int8)
+        lengths = np.zeros(lanes, dtype=np.int64)
+        program, n = self.program, len(self.program)
+
+        for _ in range(max_steps):
+            active = np.flatnonzero(ip < n - 1)
+            if not len(active):
+                break
+            for i in np.unique(ip[active]):
+                sel = active[ip[active] == i]
+                opcode, op = program[i], program[i + 1]
+                if opcode in (ADV, BST, OUT, BDV, CDV):
+                    if op == 7:
+                        raise ValueError("combo operand 7 is reserved")
+                    val = np.full(len(sel), op, dtype=np.uint64) if op < 4 else regs[op - 4, sel]
+                if opcode == ADV:
+                    regs[0, sel] = _shr(regs[0, sel], val)
+                elif opcode == BXL:
+                    regs[1, sel] ^= np.uint64(op)
+                elif opcode == BST:
+                    regs[1, sel] = val & np.uint64(7)
+                elif opcode == JNZ:
+                    ip[sel] = np.where(regs[0, sel] != 0, op - 2, i)
+                elif opcode == BXC:
+                    regs[1, sel] ^= regs[2, sel]
+                elif opcode == OUT:
+                    if lengths[sel].max() >= out.shape[1]:
+                        out = np.pad(out, ((0, 0), (0, out.shape[1])), constant_values=-1)
+                    out[sel, lengths[sel]] = val & np.uint64(7)
+                    lengths[sel] += 1
+                elif opcode == BDV:
+                    regs[1, sel] = _shr(regs[0, sel], val)
+                elif opcode == CDV:
+                    regs[2, sel] = _shr(regs[0, sel], val)
+                ip[sel] += 2
+        else:
+            raise RuntimeError(f"program did not halt within {max_steps} steps")
+        return out, lengths
+
+    def find_quine(self, b=0, c=0):
+        """Smallest A for which the program prints itself, or None.
+
+        Assumes the usual loop shape: every iteration prints one digit and
+        shifts A right by 3, so A can be built 3 bits at a time from the end
+        of the program backwards.
+        """
+        target = np.array(self.program, dtype=np.int8)
+        candidates = np.zeros(1, dtype=np.uint64)
+        for i in range(len(target) - 1, -1, -1):
+            a = (candidates[:, None] * np.uint64(8) + np.arange(8, dtype=np.uint64)).ravel()
+            out, lengths = self.run_batch(a, b, c)
+            suffix = target[i:]
+            if out.shape[1] < len(suffix):
+                out = np.pad(out, ((0, 0), (0, len(suffix) - out.shape[1])), constant_values=-1)
+            match = (lengths == len(suffix)) & (out[:, : len(suffix)] == suffix).all(axis=1)
+            candidates = a[match]
+            if not len(candidates):
+                return None
+        for a in sorted(map(int, candidates)):
+            if self.run(a, b, c) == self.program:
+                return a
+        return None
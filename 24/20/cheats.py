@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def trace_path(maze: np.ndarray):
+    """Walk the single track from S to E.
+
+    Returns the path as an ordered (L, 2) array and an index grid holding the
+    step number of every path cell and -1 everywhere else.
+    """
+    maze = np.asarray(maze)
+    open_ = maze != "#"
+    index = np.full(maze.shape, -1, dtype=np.int64)
+    pos = tuple(np.argwhere(maze == "S")[0])
+    end = tuple(np.argwhere(maze == "E")[0])
+    path = [pos]
+    index[pos] = 0
+    while pos != end:
+        x, y = pos
+        for nb in [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]:
+            if 0 <= nb[0] < maze.shape[0] and 0 <= nb[1] < maze.shape[1] and open_[nb] and index[nb] < 0:
+                pos = nb
+                break
+        else:
+            raise ValueError("track is not a single path from S to E")
+        index[pos] = len(path)
+        path.append(pos)
+    return np.array(path, dtype=np.int64), index
+
+
+def diamond(radius: int, min_dist: int = 2) -> np.ndarray:
+    """All offsets with min_dist <= |dx| + |dy| <= radius as a (K, 2) array."""
+    r = np.arange(-radius, radius + 1)
+    dx, dy = np.meshgrid(r, r, indexing="ij")
+    dist = np.abs(dx) + np.abs(dy)
+    keep = (dist >= min_dist) & (dist <= radius)
+    return np.stack([dx[keep], dy[keep]], axis=1)
+
+
+def count_cheats(path: np.ndarray, index: np.ndarray, radius: int, threshold: int, chunk: int = 1024) -> int:
+    """Number of shortcuts of Manhattan length <= radius saving at least threshold steps.
+
+    Every path cell looks up its diamond neighborhood in the index grid, so the
+    work is O(L * R^2) instead of comparing all pairs of path cells. The path is
+    processed in chunks to keep the (chunk, K) intermediates small.
+    """
+    offsets = diamond(radius)
+    dist = np.abs(offsets).sum(axis=1)
+    m, n = index.shape
+    total = 0
+    for start in range(0, len(path), chunk):
+        cells = path[start : start + chunk]
+        steps = np.arange(start, start + len(cells))[:, None]
+        targets = cells[:, None, :] + offsets[None, :, :]
+        tx, ty = targets[..., 0], targets[..., 1]
+        inside = (tx >= 0) & (tx < m) & (ty >= 0) & (ty < n)
+        landing = np.where(inside, index[np.clip(tx, 0, m - 1), np.clip(ty, 0, n - 1)], -1)
+        saved = landing - steps - dist[None, :]
+        total += int(np.count_nonzero((landing >= 0) & (saved >= threshold)))
+    return total
@@ -0,0 +1,124 @@
+import sys
+from time import perf_counter
+
+
+def _bits(m):
+    while m:
+        low = m & -m
+        yield low.bit_length() - 1
+        m ^= low
+
+
+def _intersect_sorted(a, b):
+    i = j = 0
+    common = []
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            common.append(a[i])
+            i += 1
+            j += 1
+    return common
+
+
+class Graph:
+    """Undirected graph on interned node ids with adjacency stored as int bitsets."""
+
+    def __init__(self):
+        self.names = []
+        self.index = dict()
+        self.adj = []
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        edges = sum(m.bit_count() for m in self.adj) // 2
+        return f"Graph(nodes={len(self)}, edges={edges})"
+
+    def node(self, name):
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+            self.adj.append(0)
+        return self.index[name]
+
+    def add_edge(self, a, b):
+        u, v = self.node(a), self.node(b)
+        self.adj[u] |= 1 << v
+        self.adj[v] |= 1 << u
+
+    @staticmethod
+    def from_str(s: str):
+        g = Graph()
+        for line in s.split():
+            g.add_edge(*line.split("-"))
+        return g
+
+    def forward(self):
+        # sorted neighbors with a larger id, so every triangle is seen exactly once
+        return [list(_bits((m >> (u + 1)) << (u + 1))) for u, m in enumerate(self.adj)]
+
+    def triangles(self):
+        fwd = self.forward()
+        for u in range(len(self)):
+            for v in fwd[u]:
+                for w in _intersect_sorted(fwd[u], fwd[v]):
+                    yield u, v, w
+
+    def count_triangles(self, predicate=None):
+        """Number of triangles with at least one node name matching `predicate`."""
+        if predicate is None:
+            return sum(1 for _ in self.triangles())
+        marked = [predicate(name) for name in self.names]
+        return sum(1 for t in self.triangles() if marked[t[0]] or marked[t[1]] or marked[t[2]])
+
+    def max_clique(self):
+        best = [0]
+        self._bron_kerbosch(0, (1 << len(self)) - 1, 0, best)
+        return sorted(self.names[v] for v in _bits(best[0]))
+
+    def _bron_kerbosch(self, r, p, x, best):
+        if not p and not x:
+            if r.bit_count() > best[0].bit_count():
+                best[0] = r
+            return
+        if r.bit_count() + p.bit_count() <= best[0].bit_count():
+            return
+        adj = self.adj
+        pivot = max(_bits(p | x), key=lambda u: (p & adj[u]).bit_count())
+        for v in _bits(p & ~adj[pivot]):
+            bit = 1 << v
+            self._bron_kerbosch(r | bit, p & adj[v], x & adj[v], best)
+            p &= ~bit
+            x |= bit
+
+
+def _networkx(s):
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_edges_from(line.split("-") for line in s.split())
+    triangles = [t for t in nx.simple_cycles(G, 3) if any(n[0] == "t" for n in t)]
+    return len(triangles), sorted(max(nx.find_cliques(G), key=len))
+
+
+def _lan(s):
+    g = Graph.from_str(s)
+    return g.count_triangles(lambda name: name[0] == "t"), g.max_clique()
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1] if len(sys.argv) > 1 else "input.txt") as file:
+        s = file.read()
+    for name, solve in [("bitset", _lan), ("networkx", _networkx)]:
+        start = perf_counter()
+        try:
+            result = solve(s)
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+        print(f"{name:>8}: {perf_counter() - start:.4f}s {result[0]} {','.join(result[1])}")
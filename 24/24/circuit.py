@@ -0,0 +1,187 @@
+from collections import defaultdict
+
+import numpy as np
+
+OPS = ("AND", "OR", "XOR")
+
+
+def _pairings(wires):
+    """All ways to split the wires into unordered pairs."""
+    if not wires:
+        yield []
+        return
+    first, rest = wires[0], wires[1:]
+    for k, other in enumerate(rest):
+        for pairs in _pairings(rest[:k] + rest[k + 1:]):
+            yield [(first, other)] + pairs
+
+
+class Circuit:
+    """Gate network compiled into a topologically ordered array program.
+
+    Every wire is computed exactly once per evaluation, shared sub-expressions
+    included. Wire values are NumPy uint64 words, so one evaluation simulates
+    64 independent input vectors per word.
+    """
+
+    def __init__(self, gates, initial=None):
+        self.gates = list(gates)  # (i1, op, i2, out)
+        self.initial = dict(initial or {})
+        self.outputs = {o for *_, o in self.gates}
+        inputs = sorted({w for i1, _, i2, _ in self.gates for w in (i1, i2)} - self.outputs)
+        self.wires = inputs + sorted(self.outputs)
+        self.index = {w: i for i, w in enumerate(self.wires)}
+        self.x = sorted(w for w in inputs if w[0] == "x")
+        self.y = sorted(w for w in inputs if w[0] == "y")
+        self.z = sorted(w for w in self.outputs if w[0] == "z")
+        self.levels = self._compile()
+
+    def __repr__(self):
+        return f"Circuit(gates={len(self.gates)}, x={len(self.x)}, y={len(self.y)}, z={len(self.z)})"
+
+    @staticmethod
+    def from_str(s: str):
+        start_values, gates = s.strip().split("\n\n")
+        initial = dict()
+        for sv in start_values.split("\n"):
+            wire, value = sv.split(": ")
+            initial[wire] = int(value)
+        parsed = []
+        for gate in gates.split("\n"):
+            i, o = gate.split(" -> ")
+            i1, op, i2 = i.split(" ")
+            parsed.append((i1, op, i2, o))
+        return Circuit(parsed, initial)
+
+    def _compile(self):
+        # Kahn's algorithm, gates of one level only depend on earlier levels
+        depth = {w: 0 for w in self.wires if w not in self.outputs}
+        consumers = defaultdict(list)
+        missing = []
+        for g, (i1, _, i2, _) in enumerate(self.gates):
+            missing.append(len({i1, i2} - depth.keys()))
+            for w in {i1, i2}:
+                consumers[w].append(g)
+        ready = [g for g in range(len(self.gates)) if missing[g] == 0]
+        levels = defaultdict(list)
+        while ready:
+            next_ready = []
+            for g in ready:
+                i1, op, i2, o = self.gates[g]
+                depth[o] = max(depth[i1], depth[i2]) + 1
+                levels[depth[o]].append(g)
+                for c in consumers[o]:
+                    missing[c] -= 1
+                    if missing[c] == 0:
+                        next_ready.append(c)
+            ready = next_ready
+        if len(depth) != len(self.wires):
+            raise ValueError("circuit contains a cycle")
+
+        program = []
+        for level in sorted(levels):
+            for op in OPS:
+                gs = [self.gates[g] for g in levels[level] if self.gates[g][1] == op]
+                if gs:
+                    program.append((
+                        op,
+                        np.array([self.index[i1] for i1, *_ in gs]),
+                        np.array([self.index[i2] for _, _, i2, _ in gs]),
+                        np.array([self.index[o] for *_, o in gs]),
+                    ))
+        return program
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """Run the program on an (n_wires, W) uint64 array with the inputs filled in."""
+        for op, a, b, o in self.levels:
+            if op == "AND":
+                values[o] = values[a] & values[b]
+            elif op == "OR":
+                values[o] = values[a] | values[b]
+            else:
+                values[o] = values[a] ^ values[b]
+        return values
+
+    def run(self, initial=None) -> int:
+        initial = self.initial if initial is None else initial
+        values = np.zeros((len(self.wires), 1), dtype=np.uint64)
+        for wire, value in initial.items():
+            if wire in self.index:
+                values[self.index[wire]] = value
+        values = self.evaluate(values)
+        return sum(int(values[self.index[z], 0]) << k for k, z in enumerate(self.z))
+
+    def simulate(self, xs, ys) -> np.ndarray:
+        """z for many (x, y) pairs, packed 64 test vectors per machine word."""
+        xs = np.asarray(xs, dtype=np.uint64).ravel()
+        ys = np.asarray(ys, dtype=np.uint64).ravel()
+        n = len(xs)
+        words = -(-n // 64)
+        lanes = np.arange(64, dtype=np.uint64)
+        values = np.zeros((len(self.wires), words), dtype=np.uint64)
+        for wires, numbers in [(self.x, xs), (self.y, ys)]:
+            for k, wire in enumerate(wires):
+                bits = np.zeros(words * 64, dtype=np.uint64)
+                bits[:n] = (numbers >> np.uint64(k)) & np.uint64(1)
+                values[self.index[wire]] = np.bitwise_or.reduce(bits.reshape(words, 64) << lanes, axis=1)
+        values = self.evaluate(values)
+        z = np.zeros(words * 64, dtype=np.uint64)
+        for k, wire in enumerate(self.z):
+            bits = (values[self.index[wire]][:, None] >> lanes) & np.uint64(1)
+            z |= bits.ravel() << np.uint64(k)
+        return z[:n]
+
+    def check_adder(self, samples=1024, seed=0) -> bool:
+        rng = np.random.default_rng(seed)
+        bits = len(self.x)
+        # single-bit carries catch most miswirings, random pairs catch the rest
+        xs = [1 << k for k in range(bits)] + [(1 << k) - 1 for k in range(bits)]
+        ys = [1 << k for k in range(bits)] + [1] * bits
+        xs = np.concatenate([xs, rng.integers(0, 1 << bits, samples, dtype=np.uint64)]).astype(np.uint64)
+        ys = np.concatenate([ys, rng.integers(0, 1 << bits, samples, dtype=np.uint64)]).astype(np.uint64)
+        return bool((self.simulate(xs, ys) == xs + ys).all())
+
+    def find_swaps(self) -> list:
+        """Output wires that break the ripple-carry adder structure.
+
+        z_k = x_k ^ y_k ^ carry_k and carry_k+1 = (x_k & y_k) | (carry_k & (x_k ^ y_k)),
+        so every z but the last comes from an XOR, XORs of carries write to z,
+        half-adder XORs feed an XOR and every AND (except bit 0) feeds an OR.
+        """
+        first = {self.x[0], self.y[0]}
+        last_z = self.z[-1]
+        feeds = defaultdict(set)
+        for i1, op, i2, _ in self.gates:
+            feeds[i1].add(op)
+            feeds[i2].add(op)
+        wrong = set()
+        for i1, op, i2, o in self.gates:
+            from_inputs = i1[0] in "xy" and i2[0] in "xy"
+            if o[0] == "z" and op != "XOR" and o != last_z:
+                wrong.add(o)
+            elif op == "XOR" and not from_inputs and o[0] != "z":
+                wrong.add(o)
+            elif op == "XOR" and from_inputs and {i1, i2} != first and "XOR" not in feeds[o]:
+                wrong.add(o)
+            elif op == "AND" and {i1, i2} != first and "OR" not in feeds[o]:
+                wrong.add(o)
+        return sorted(wrong)
+
+    def with_swaps(self, pairs):
+        """Copy of the circuit with the output wires of every pair exchanged."""
+        rename = dict()
+        for a, b in pairs:
+            rename[a], rename[b] = b, a
+        return Circuit([(i1, op, i2, rename.get(o, o)) for i1, op, i2, o in self.gates], self.initial)
+
+    def repair(self, wires=None) -> list:
+        """Pairs of the wires from find_swaps whose exchange makes the circuit add."""
+        wires = self.find_swaps() if wires is None else sorted(wires)
+        for pairs in _pairings(wires):
+            try:
+                fixed = self.with_swaps(pairs)
+            except ValueError:  # the swap closed a loop
+                continue
+            if fixed.check_adder():
+                return pairs
+        raise ValueError("no pairing of the wires repairs the adder")
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from types import CodeType
+
+import numpy as np
+
+from utils.utils import Matrix
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", "~/.cache/aoc")).expanduser()
+MAX_BYTES = int(os.environ.get("AOC_CACHE_BYTES", 512 * 2**20))
+
+
+def _hash_code(h, code):
+    # nested code objects (comprehensions, inner functions) repr with their
+    # memory address, so they are hashed by content instead
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _key(data: bytes, parser, version) -> str:
+    h = hashlib.sha256(data)
+    h.update(f"{parser.__module__}.{parser.__qualname__}:{version}".encode())
+    code = getattr(parser, "__code__", None)
+    if code is not None:
+        # edits to the parser's own body invalidate its entries, edits to the
+        # helpers and globals it uses are not seen and need a version bump
+        _hash_code(h, code)
+    return h.hexdigest()
+
+
+def _write_atomic(path: Path, write):
+    # parallel workers may store the same entry, the last rename simply wins
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def evict(cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_BYTES):
+    """Drop the least recently used entries until the cache fits into max_bytes."""
+    entries = []
+    for p in cache_dir.glob("*"):
+        if p.suffix in (".npy", ".pkl"):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:  # removed by a concurrent evict
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+
+
+def parse_cached(path, parser, version=1, cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_BYTES):
+    """parser(text of path), stored on disk under the hash of the file and the parser.
+
+    Arrays and Matrix grids are kept as .npy and memory-mapped copy-on-write
+    when loaded, so repeated runs and worker processes share the pages of one
+    file and can still modify their grid. Everything else is pickled.
+
+    The key covers the parser's own code but not the helpers, regexes or
+    methods it calls (e.g. Matrix.from_str), bump `version` after editing those.
+    """
+    data = Path(path).read_bytes()
+    key = _key(data, parser, version)
+    cache_dir = Path(cache_dir)
+    for suffix in (".npy", ".matrix.npy", ".pkl"):
+        entry = cache_dir / (key + suffix)
+        # another worker's evict may remove the entry at any point until it is open
+        try:
+            os.utime(entry)
+            if suffix == ".pkl":
+                with open(entry, "rb") as f:
+                    return pickle.load(f)
+            array = np.load(entry, mmap_mode="c")
+        except FileNotFoundError:
+            continue
+        return array.view(Matrix if suffix == ".matrix.npy" else np.ndarray)
+
+    result = parser(data.decode())
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if isinstance(result, np.ndarray) and result.dtype != object:
+        suffix = ".matrix.npy" if isinstance(result, Matrix) else ".npy"
+        _write_atomic(cache_dir / (key + suffix), lambda f: np.save(f, np.asarray(result)))
+    else:
+        _write_atomic(cache_dir / (key + ".pkl"), lambda f: pickle.dump(result, f, pickle.HIGHEST_PROTOCOL))
+    evict(cache_dir, max_bytes)
+    return result
@@ -0,0 +1,57 @@
+def parse(s: str):
+    ranges = []
+    for rng in s.strip().split(","):
+        lower, upper = rng.split("-")
+        ranges.append((int(lower), int(upper)))
+    return ranges
+
+
+def _mobius(n: int) -> int:
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def block_sum(lower: int, upper: int, length: int, k: int):
+    """Count and sum of the numbers in [lower, upper] made of one `length`-digit block repeated k times.
+
+    Every such number is block * (10^(k*length) - 1) / (10^length - 1), so the
+    matches form an arithmetic series over the block range.
+    """
+    multiplier = (10 ** (k * length) - 1) // (10**length - 1)
+    lo = max(10 ** (length - 1), -(-lower // multiplier))
+    hi = min(10**length - 1, upper // multiplier)
+    if lo > hi:
+        return 0, 0
+    count = hi - lo + 1
+    return count, multiplier * (lo + hi) * count // 2
+
+
+def repeated_ids(lower: int, upper: int, k=2):
+    """Count and sum of the IDs in [lower, upper] that are a block repeated k times.
+
+    With k=None every repetition count >= 2 is accepted. A D-digit number can
+    repeat blocks of several lengths (222222 is 2x"222", 3x"22" and 6x"2"), so
+    the union over all divisors d > 1 of D is built with Moebius inclusion-
+    exclusion instead of deduplicating a set.
+    """
+    lower = max(lower, 1)
+    count = total = 0
+    for digits in range(len(str(lower)), len(str(upper)) + 1):
+        if k is not None:
+            if digits % k == 0:
+                c, s = block_sum(lower, upper, digits // k, k)
+                count, total = count + c, total + s
+            continue
+        for d in range(2, digits + 1):
+            if digits % d == 0 and (mu := _mobius(d)):
+                c, s = block_sum(lower, upper, digits // d, d)
+                count, total = count - mu * c, total - mu * s
+    return count, total
@@ -0,0 +1,98 @@
+from collections import deque
+
+import numpy as np
+
+
+class DAG:
+    """Directed acyclic graph on interned node ids with a precomputed topological order."""
+
+    def __init__(self, cons: dict):
+        self.names = []
+        self.index = dict()
+        for node, targets in cons.items():
+            for name in [node, *targets]:
+                self.node(name)
+        self.succ = [[] for _ in self.names]
+        for node, targets in cons.items():
+            self.succ[self.index[node]] = [self.index[t] for t in targets]
+        self.order = self._topological_order()
+        self.pos = np.empty(len(self.names), dtype=np.int64)
+        self.pos[self.order] = np.arange(len(self.order))
+
+    def __repr__(self):
+        return f"DAG(nodes={len(self.names)}, edges={sum(map(len, self.succ))})"
+
+    def node(self, name):
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+        return self.index[name]
+
+    @staticmethod
+    def from_lines(lines):
+        cons = dict()
+        for line in lines:
+            a, b = line.split(": ")
+            cons[a] = b.split(" ")
+        return DAG(cons)
+
+    def _topological_order(self):
+        indegree = [0] * len(self.names)
+        for targets in self.succ:
+            for t in targets:
+                indegree[t] += 1
+        queue = deque(i for i, d in enumerate(indegree) if d == 0)
+        order = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in self.succ[u]:
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    queue.append(v)
+        if len(order) != len(self.names):
+            raise ValueError("graph contains a cycle")
+        return order
+
+    def count_paths(self, source, sink, waypoints=()):
+        """Number of paths from source to sink that visit every waypoint.
+
+        Iterative DP over the topological order between source and sink that
+        keeps a sparse {visited waypoint mask: count} per node. Edges only go
+        forward in the order, so a mask that misses a waypoint already passed
+        can never be completed and is dropped; only reachable, completable masks
+        are stored, and any number of waypoints works. Counts are Python ints
+        and never overflow.
+        """
+        if source not in self.index or sink not in self.index:
+            return 0
+        if any(w not in self.index for w in waypoints):
+            return 0
+        bit = dict()
+        for j, w in enumerate(waypoints):
+            bit[self.index[w]] = bit.get(self.index[w], 0) | 1 << j
+        full = (1 << len(waypoints)) - 1
+
+        start, end = self.pos[self.index[source]], self.pos[self.index[sink]]
+        if start > end or any(not start <= self.pos[w] <= end for w in bit):
+            return 0
+        window = self.order[start : end + 1]
+        passed = [0]  # waypoints strictly before each row of the window
+        for u in window:
+            passed.append(passed[-1] | bit.get(u, 0))
+        dp = [dict() for _ in window]
+        dp[0][bit.get(window[0], 0)] = 1
+        for r, u in enumerate(window):
+            row = dp[r]
+            for v in self.succ[u]:
+                if self.pos[v] > end:
+                    continue
+                k = self.pos[v] - start
+                target, b, need = dp[k], bit.get(v, 0), passed[k]
+                for mask, count in row.items():
+                    mask |= b
+                    if mask & need == need:
+                        target[mask] = target.get(mask, 0) + count
+            if r < len(window) - 1:
+                dp[r] = None
+        return dp[-1].get(full, 0)
@@ -0,0 +1 @@
+"""Runner and benchmark suite for the solutions under 23/, 24/ and 25/."""
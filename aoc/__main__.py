@@ -0,0 +1,97 @@
+"""Run or benchmark a day's solution.
+
+    python -m aoc run 24 13 [part]
+    python -m aoc bench 24 13 [part] --repeat 5 --json report.json
+    python -m aoc bench 24 --baseline report.json --profile
+    python -m aoc list [year]
+"""
+
+import argparse
+import sys
+
+from . import bench
+from .solutions import YEARS, discover, load
+
+
+def _time(seconds):
+    return f"{seconds * 1e3:10.3f}ms"
+
+
+def cmd_list(args):
+    for year, day in discover([args.year] if args.year else YEARS):
+        print(f"{year}/{day}")
+
+
+def _load(year, day, args):
+    solution = load(year, day, args.solution, args.input)
+    if not solution.marked:
+        print(f"{solution.key}: no Part headings in {solution.path.name}, "
+              "everything after the first cell is timed as part 1", file=sys.stderr)
+    return solution
+
+
+def cmd_run(args):
+    solution = _load(args.year, args.day, args)
+    for phase, (seconds, value) in bench.run(solution, args.part, quiet=False).items():
+        print(f"{phase:>6}: {_time(seconds)}  {'' if value is None else value}".rstrip())
+
+
+def cmd_bench(args):
+    if args.day is None:
+        days = discover([f"{int(args.year):02d}"])
+    else:
+        days = [(args.year, args.day)]
+    report = {"environment": bench.environment(), "days": dict()}
+    for year, day in days:
+        solution = _load(year, day, args)
+        try:
+            entry = bench.bench(solution, args.part, args.repeat, args.tracemalloc)
+        except Exception as e:
+            print(f"{solution.key}: {type(e).__name__}: {e}", file=sys.stderr)
+            continue
+        report["days"][solution.key] = entry
+        for phase, stats in entry["phases"].items():
+            memory = entry.get("peak_memory", {}).get(phase)
+            memory = f"  peak {memory / 2**20:8.2f}MiB" if memory is not None else ""
+            print(f"{solution.key} {phase:>6}: min {_time(stats['min'])}  median {_time(stats['median'])}{memory}")
+        if args.profile:
+            print(bench.profile(solution, args.part, args.profile))
+
+    if args.json:
+        bench.save_report(report, args.json)
+    if args.baseline:
+        lines, regressed = bench.compare(report, bench.load_report(args.baseline), args.tolerance)
+        print("\n".join(lines))
+        return 1 if regressed else 0
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__.split("\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="list the days that have a solution")
+    p.add_argument("year", nargs="?")
+    p.set_defaults(func=cmd_list)
+
+    for name, func in [("run", cmd_run), ("bench", cmd_bench)]:
+        p = sub.add_parser(name, help=f"{name} a solution")
+        p.add_argument("year")
+        p.add_argument("day", nargs=None if name == "run" else "?")
+        p.add_argument("part", nargs="?", choices=["1", "2"])
+        p.add_argument("--solution", help="notebook or script in the day folder, default DD.ipynb")
+        p.add_argument("--input", help="file name to read instead of input.txt/test.txt")
+        p.set_defaults(func=func)
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--json", help="write the report to this file")
+    p.add_argument("--baseline", help="compare against a report written by --json")
+    p.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown before flagging, default 10%%")
+    p.add_argument("--profile", type=int, nargs="?", const=20, default=0, help="print the N hottest functions")
+    p.add_argument("--tracemalloc", action="store_true", help="record the peak memory of every phase")
+
+    args = parser.parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
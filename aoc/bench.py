@@ -0,0 +1,184 @@
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import statistics
+import sys
+import tracemalloc
+import types
+from contextlib import contextmanager, redirect_stdout
+from time import perf_counter
+
+from .solutions import PHASES, Solution
+
+
+@contextmanager
+def day_context(solution: Solution, quiet=True):
+    """Run inside the day folder like the notebooks expect.
+
+    The folder and its parent are put on sys.path for the local modules and
+    `utils`, stdin is empty so interactive scripts fail instead of hanging, and
+    modules imported from the year folder are dropped again afterwards so the
+    next day gets its own `utils`. Yields the namespace of a fresh module that
+    is registered in sys.modules while the solution runs, which dataclasses
+    and pickle need to find the classes it defines. Scripts run as __main__
+    see the input file as their only argument.
+    """
+    cwd, path, stdin, argv = os.getcwd(), list(sys.path), sys.stdin, sys.argv
+    year_dir = str(solution.directory.parent)
+    before = set(sys.modules)
+    replaced = sys.modules.get(solution.module)
+    module = types.ModuleType(solution.module)
+    module.__file__ = str(solution.path)
+    os.chdir(solution.directory)
+    sys.path[:0] = [str(solution.directory), year_dir]
+    sys.stdin = io.StringIO()
+    sys.argv = [str(solution.path), solution.input]
+    sys.modules[solution.module] = module
+    try:
+        with redirect_stdout(io.StringIO()) if quiet else redirect_stdout(sys.stdout):
+            yield module.__dict__
+    finally:
+        os.chdir(cwd)
+        sys.path[:] = path
+        sys.stdin = stdin
+        sys.argv = argv
+        if replaced is None:
+            sys.modules.pop(solution.module, None)
+        else:
+            sys.modules[solution.module] = replaced
+        for name in set(sys.modules) - before:
+            if (getattr(sys.modules[name], "__file__", None) or "").startswith(year_dir):
+                del sys.modules[name]
+
+
+def run_phase(cells, namespace):
+    result = None
+    for cell in cells:
+        exec(cell.code, namespace)
+        result = eval(cell.expr, namespace) if cell.expr is not None else None
+    return result
+
+
+def phases_for(part):
+    return PHASES if part is None else PHASES[: int(part) + 1]
+
+
+def run(solution: Solution, part=None, quiet=True, on_phase=None):
+    """Execute the solution once, returns {phase: (seconds, result)}."""
+    results = dict()
+    with day_context(solution, quiet) as namespace:
+        for phase in phases_for(part):
+            if on_phase is not None:
+                on_phase(phase)
+            start = perf_counter()
+            value = run_phase(solution.phases[phase], namespace)
+            results[phase] = (perf_counter() - start, value)
+    return results
+
+
+def _summary(runs):
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "runs": runs,
+    }
+
+
+def bench(solution: Solution, part=None, repeat=5, memory=False):
+    """Time every phase over `repeat` fresh runs and build a JSON-able report entry."""
+    timings = {phase: [] for phase in phases_for(part)}
+    answers = dict()
+    for _ in range(repeat):
+        for phase, (seconds, value) in run(solution, part).items():
+            timings[phase].append(seconds)
+            if value is not None:
+                answers[phase] = repr(value)[:200]
+    report = {
+        "solution": str(solution.path.relative_to(solution.directory.parent.parent)),
+        "repeat": repeat,
+        "phases": {phase: _summary(runs) for phase, runs in timings.items()},
+        "answers": answers,
+    }
+    if memory:
+        report["peak_memory"] = peak_memory(solution, part)
+    return report
+
+
+def peak_memory(solution: Solution, part=None):
+    """Peak traced allocation in bytes per phase, from one extra run under tracemalloc."""
+    peaks = dict()
+    current = [None]
+
+    def on_phase(phase):
+        if current[0] is not None:
+            peaks[current[0]] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        current[0] = phase
+
+    tracemalloc.start()
+    try:
+        run(solution, part, on_phase=on_phase)
+        peaks[current[0]] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def profile(solution: Solution, part=None, top=20, sort="tottime"):
+    """Run once under cProfile and return the formatted table of the hottest functions."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        run(solution, part)
+    finally:
+        profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(top)
+    return out.getvalue()
+
+
+def environment():
+    return {"python": platform.python_version(), "machine": platform.machine(), "platform": platform.platform()}
+
+
+def compare(report, baseline, tolerance=0.1):
+    """Lines comparing the min time of every phase against a stored baseline.
+
+    Returns the lines and whether any phase got slower than 1 + tolerance times
+    its baseline.
+    """
+    lines, regressed = [], False
+    for key, entry in report["days"].items():
+        base = baseline.get("days", {}).get(key)
+        if base is None:
+            lines.append(f"{key}: no baseline")
+            continue
+        for phase, stats in entry["phases"].items():
+            if phase not in base["phases"]:
+                continue
+            old, new = base["phases"][phase]["min"], stats["min"]
+            ratio = new / old if old else float("inf")
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag, regressed = "  REGRESSION", True
+            lines.append(f"{key} {phase:>6}: {old * 1e3:10.3f}ms -> {new * 1e3:10.3f}ms  x{ratio:5.2f}{flag}")
+        for phase, answer in entry["answers"].items():
+            if base["answers"].get(phase, answer) != answer:
+                lines.append(f"{key} {phase:>6}: answer changed {base['answers'][phase]} -> {answer}  MISMATCH")
+                regressed = True
+    return lines, regressed
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+        f.write("\n")
@@ -0,0 +1,166 @@
+import ast
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+YEARS = ("23", "24", "25")
+PHASES = ("parse", "part1", "part2")
+
+# "# Part 1", "### Task 2", or a code cell starting with "# part 2: ..."
+_marker = re.compile(r"^\s*#+\s*(?:part|task)\s*([12])\b", re.IGNORECASE)
+_input_name = re.compile(r"""(["'])(?:input|test\d*)\.txt\1""")
+_part_function = re.compile(r"^part_?([12])$")
+
+# scripts with part_1/part_2 read the input into a file object they can seek
+_entry_parse = """\
+import io as _aoc_io
+with open({input!r}) as _aoc_file:
+    _aoc_input = _aoc_io.StringIO(_aoc_file.read())
+"""
+
+
+@dataclass
+class Cell:
+    source: str
+    code: object = None  # compiled statements
+    expr: object = None  # compiled trailing expression, its value is the cell's result
+
+
+@dataclass
+class Solution:
+    year: str
+    day: str
+    path: Path
+    input: str = "input.txt"
+    module: str = "__main__"  # __name__ the code runs under
+    marked: bool = True  # phases come from part markers or part functions
+    phases: dict = field(default_factory=dict)
+
+    def __repr__(self):
+        counts = ", ".join(f"{p}={len(c)}" for p, c in self.phases.items())
+        return f"Solution({self.key}, {self.path.name}, {counts})"
+
+    @property
+    def key(self):
+        return f"{self.year}/{self.day}"
+
+    @property
+    def directory(self):
+        return self.path.parent
+
+
+def read_cells(path: Path):
+    """Code cells of a notebook or script as (source, kind, is_marker) tuples in file order."""
+    if path.suffix == ".ipynb":
+        cells = []
+        for cell in json.loads(path.read_text())["cells"]:
+            source = "".join(cell["source"])
+            cells.append((source, cell["cell_type"], bool(_marker.match(source))))
+        return cells
+    # scripts are split into pseudo cells at their part marker comments
+    cells, current = [], []
+    for line in path.read_text().splitlines():
+        if _marker.match(line) and not line.startswith((" ", "\t")):
+            cells.append(("\n".join(current), "code", False))
+            current = []
+            cells.append((line, "markdown", True))
+        else:
+            current.append(line)
+    cells.append(("\n".join(current), "code", False))
+    return cells
+
+
+def split_phases(cells):
+    """Group code cells into parse, part1 and part2.
+
+    Everything before the first "Part 1" marker is parsing. Without such a
+    marker only the first code cell counts as parsing and the rest as part 1
+    until a "Part 2" marker shows up.
+    """
+    phases = {p: [] for p in PHASES}
+    has_part1 = any(m and _marker.match(s).group(1) == "1" for s, _, m in cells)
+    phase = 0
+    for source, kind, is_marker in cells:
+        if is_marker:
+            phase = max(phase, int(_marker.match(source).group(1)))
+        if kind != "code" or not source.strip():
+            continue
+        phases[PHASES[phase]].append(source)
+        if phase == 0 and not has_part1:
+            phase = 1
+    return phases
+
+
+def _strip_magics(source):
+    return "\n".join("" if line.lstrip().startswith(("%", "!")) else line for line in source.split("\n"))
+
+
+def compile_cell(source, filename, input_name=None):
+    source = _strip_magics(source)
+    if input_name is not None:
+        source = _input_name.sub(lambda m: m.group(1) + input_name + m.group(1), source)
+    tree = ast.parse(source, filename)
+    expr = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        expr = compile(ast.Expression(tree.body.pop().value), filename, "eval")
+    return Cell(source, compile(tree, filename, "exec"), expr)
+
+
+def part_functions(source):
+    """{"1": name, "2": name} of the top level part_1/part_2 functions of a script."""
+    found = dict()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.FunctionDef) and (m := _part_function.match(node.name)):
+            found.setdefault(m.group(1), node.name)
+    return found
+
+
+def solution_files(year, day):
+    directory = ROOT / year / day
+    if not directory.is_dir():
+        return []
+    files = sorted(directory.glob("*.ipynb")) + sorted(directory.glob("*.py"))
+    # DD.ipynb first, then DD.py, then whatever else lives in the folder
+    return sorted(files, key=lambda f: (f.stem != day, f.suffix != ".ipynb"))
+
+
+def load(year, day, name=None, input_name=None) -> Solution:
+    year, day = f"{int(year):02d}", f"{int(day):02d}"
+    files = solution_files(year, day)
+    if name is not None:
+        files = [f for f in files if f.name == name or f.stem == name]
+    if not files:
+        raise FileNotFoundError(f"no solution found for {year}/{day}" + (f" named {name}" if name else ""))
+    path = files[0]
+    solution = Solution(year, day, path, input_name or "input.txt")
+    functions = part_functions(path.read_text()) if path.suffix == ".py" else dict()
+    if functions:
+        # importing the script is parsing, the parts are calls with the input file,
+        # its `if __name__ == "__main__"` block with the argument handling is skipped
+        solution.module = "__aoc__"
+        phases = {
+            "parse": [path.read_text(), _entry_parse.format(input=solution.input)],
+            "part1": [f"{functions['1']}(_aoc_input)"] if "1" in functions else [],
+            "part2": [f"{functions['2']}(_aoc_input)"] if "2" in functions else [],
+        }
+    else:
+        cells = read_cells(path)
+        solution.marked = any(is_marker for *_, is_marker in cells)
+        phases = split_phases(cells)
+    for phase, sources in phases.items():
+        solution.phases[phase] = [
+            compile_cell(s, f"{path.relative_to(ROOT)}[{phase}:{i}]", input_name) for i, s in enumerate(sources)
+        ]
+    return solution
+
+
+def discover(years=YEARS):
+    """All (year, day) pairs that have a solution file."""
+    found = []
+    for year in years:
+        for directory in sorted((ROOT / year).glob("[0-9][0-9]")):
+            if solution_files(year, directory.name):
+                found.append((year, directory.name))
+    return found